@@ -6,8 +6,9 @@ import math
 pygame.init()
 
 # Window settings
-width, height = 700, 775  # Optimized height to fit on screen
-win = pygame.display.set_mode((width, height))
+base_width, base_height = 700, 775  # Design size, scaled to fit the window
+width, height = base_width, base_height
+win = pygame.display.set_mode((width, height), pygame.RESIZABLE)
 pygame.display.set_caption("Tic-Tac-Toe")
 
 # Colors
@@ -39,27 +40,79 @@ ai_color = (255, 105, 180)
 win_line = (255, 182, 193)      
 grid_color = (220, 220, 230)   
 
+# Layout
+scale = 1.0
+offset_x, offset_y = 0, 0
+
+# Scale a length from design units to pixels
+def sv(v):
+    return max(1, round(v * scale))
+
+# Map design coordinates to window pixels
+def sx(x):
+    return offset_x + round(x * scale)
+
+def sy(y):
+    return offset_y + round(y * scale)
+
+def design_rect(x, y, w, h):
+    return pygame.Rect(sx(x), sy(y), sv(w), sv(h))
+
 # Fonts
-try:
-    # Try modern sans-serif fonts
-    title_font = pygame.font.Font(None, 72)
-    sub_font = pygame.font.Font(None, 42)
-    button_font = pygame.font.Font(None, 32)
-    info_font = pygame.font.Font(None, 26)
-    small_font = pygame.font.Font(None, 22)
-except:
-    # Fall back to system fonts
-    title_font = pygame.font.SysFont("Arial", 72, bold=True)
-    sub_font = pygame.font.SysFont("Arial", 42)
-    button_font = pygame.font.Font(None, 32)
-    info_font = pygame.font.SysFont("Arial", 26)
-    small_font = pygame.font.SysFont("Arial", 22)
-
-# Game constants
-board_size = 450 
-cell_size = board_size // 3
-board_margin = (width - board_size) // 2
-board_y = 120 
+def load_fonts():
+    global title_font, sub_font, button_font, info_font, small_font
+    try:
+        # Try modern sans-serif fonts
+        title_font = pygame.font.Font(None, sv(72))
+        sub_font = pygame.font.Font(None, sv(42))
+        button_font = pygame.font.Font(None, sv(32))
+        info_font = pygame.font.Font(None, sv(26))
+        small_font = pygame.font.Font(None, sv(22))
+    except:
+        # Fall back to system fonts
+        title_font = pygame.font.SysFont("Arial", sv(72), bold=True)
+        sub_font = pygame.font.SysFont("Arial", sv(42))
+        button_font = pygame.font.Font(None, sv(32))
+        info_font = pygame.font.SysFont("Arial", sv(26))
+        small_font = pygame.font.SysFont("Arial", sv(22))
+
+# Static layers, composed once per window size
+layer_cache = {}
+
+def get_layer(key, build, alpha=False):
+    layer = layer_cache.get(key)
+    if layer is None:
+        if alpha:
+            layer = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        else:
+            layer = pygame.Surface((width, height)).convert()
+        build(layer)
+        layer_cache[key] = layer
+    return layer
+
+def update_layout(w, h):
+    global width, height, scale, offset_x, offset_y
+    global board_size, cell_size, board_margin, board_y
+    width, height = w, h
+    scale = min(width / base_width, height / base_height)
+    offset_x = (width - round(base_width * scale)) // 2
+    offset_y = (height - round(base_height * scale)) // 2
+
+    # Game constants
+    cell_size = sv(150)
+    board_size = cell_size * 3
+    board_margin = sx(125)
+    board_y = sy(120)
+
+    load_fonts()
+    layer_cache.clear()
+
+def resize_window(w, h):
+    global win
+    win = pygame.display.set_mode((w, h), pygame.RESIZABLE)
+    update_layout(w, h)
+
+update_layout(width, height)
 
 player = "X"
 ai = "O"
@@ -68,6 +121,7 @@ empty = " "
 board = [empty] * 9
 game_over = False
 winner = None
+forced_win = False
 difficulty = "hard"
 first_player = "player"
 current_turn = player
@@ -79,7 +133,9 @@ win_combos = [
 ]
 
 # Shadow
-def draw_shadow(surface, rect, color, radius=0, offset=(2, 2), alpha=20):
+def draw_shadow(surface, rect, color, radius=0, offset=None, alpha=20):
+    if offset is None:
+        offset = (sv(2), sv(2))
     shadow_rect = pygame.Rect(rect.x + offset[0], rect.y + offset[1], 
                              rect.width, rect.height)
     shadow_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
@@ -91,7 +147,7 @@ def draw_shadow(surface, rect, color, radius=0, offset=(2, 2), alpha=20):
 class Button:
     def __init__(self, x, y, w, h, text, color=button_bg, hover_color=button_hover, 
                  func=None, is_toggle=False, icon=None):
-        self.rect = pygame.Rect(x, y, w, h)
+        self.pos = (x, y, w, h)  # Design coordinates
         self.text = text
         self.color = color
         self.hover_color = hover_color
@@ -100,10 +156,18 @@ class Button:
         self.active = False
         self.icon = icon
         self.border_radius = 10
-        
-    def draw(self, surface=win):
+
+    @property
+    def rect(self):
+        return design_rect(*self.pos)
+
+    def draw(self, surface=None):
+        if surface is None:
+            surface = win
+        rect = self.rect
+        radius = sv(self.border_radius)
         mouse_pos = pygame.mouse.get_pos()
-        is_hovering = self.rect.collidepoint(mouse_pos)
+        is_hovering = rect.collidepoint(mouse_pos)
         
         # Choose color based on state
         if self.active and self.is_toggle:
@@ -120,18 +184,18 @@ class Button:
             text_color = medium_text
         
         # Draw subtle shadow
-        draw_shadow(surface, self.rect, (0, 0, 0), self.border_radius)
+        draw_shadow(surface, rect, (0, 0, 0), radius)
         
         # Draw button background
-        pygame.draw.rect(surface, color, self.rect, border_radius=self.border_radius)
+        pygame.draw.rect(surface, color, rect, border_radius=radius)
         
         # Draw thin border
-        pygame.draw.rect(surface, border_color, self.rect, 1, border_radius=self.border_radius)
+        pygame.draw.rect(surface, border_color, rect, 1, border_radius=radius)
         
         # Draw text
         txt = button_font.render(self.text, True, text_color)
-        text_x = self.rect.x + (self.rect.width - txt.get_width()) // 2
-        text_y = self.rect.y + (self.rect.height - txt.get_height()) // 2
+        text_x = rect.x + (rect.width - txt.get_width()) // 2
+        text_y = rect.y + (rect.height - txt.get_height()) // 2
         surface.blit(txt, (text_x, text_y))
         
         return is_hovering
@@ -144,36 +208,54 @@ class Button:
         return True
 
 # Game logic
-def draw_board():
-    win.fill(background)
+def build_board_layer(layer):
+    layer.fill(background)
     
     # Draw the header card
-    header_rect = pygame.Rect(40, 20, width - 80, 80)
-    draw_shadow(win, header_rect, (0, 0, 0), 15)
-    pygame.draw.rect(win, card_bg, header_rect, border_radius=15)
+    header_rect = design_rect(40, 20, 620, 80)
+    draw_shadow(layer, header_rect, (0, 0, 0), sv(15))
+    pygame.draw.rect(layer, card_bg, header_rect, border_radius=sv(15))
     
     # Draw the title
     title_text = "Tic-Tac-Toe"
     title_surf = title_font.render(title_text, True, dark_text)
-    win.blit(title_surf, (width//2 - title_surf.get_width()//2, 45))
+    layer.blit(title_surf, (width//2 - title_surf.get_width()//2, sy(45)))
     
     # Draw the board container with a shadow
-    board_container = pygame.Rect(board_margin - 15, board_y - 15, 
-                                 board_size + 30, board_size + 30)
-    draw_shadow(win, board_container, (0, 0, 0), 20, alpha=15)
-    pygame.draw.rect(win, card_bg, board_container, border_radius=20)
+    board_container = pygame.Rect(board_margin - sv(15), board_y - sv(15), 
+                                 board_size + sv(30), board_size + sv(30))
+    draw_shadow(layer, board_container, (0, 0, 0), sv(20), alpha=15)
+    pygame.draw.rect(layer, card_bg, board_container, border_radius=sv(20))
     
     # Draw the grid lines
     for i in range(1, 3):
         # Vertical lines
         x = board_margin + i * cell_size
-        pygame.draw.line(win, grid_color, (x, board_y), 
-                        (x, board_y + board_size), 3)
+        pygame.draw.line(layer, grid_color, (x, board_y), 
+                        (x, board_y + board_size), sv(3))
         
         # Horizontal lines
         y = board_y + i * cell_size
-        pygame.draw.line(win, grid_color, (board_margin, y), 
-                        (board_margin + board_size, y), 3)
+        pygame.draw.line(layer, grid_color, (board_margin, y), 
+                        (board_margin + board_size, y), sv(3))
+    
+    # Draw the status card
+    status_rect = design_rect(40, 590, 620, 70)
+    draw_shadow(layer, status_rect, (0, 0, 0), sv(12))
+    pygame.draw.rect(layer, card_bg, status_rect, border_radius=sv(12))
+    
+    # Draw the control panel
+    panel_rect = design_rect(40, 665, 620, 80)
+    draw_shadow(layer, panel_rect, (0, 0, 0), sv(15))
+    pygame.draw.rect(layer, accent_bg, panel_rect, border_radius=sv(15))
+    
+    # Show game info
+    info_text = f"{difficulty.upper()} MODE  •  {first_player.upper()} STARTS"
+    info_surf = info_font.render(info_text, True, medium_text)
+    layer.blit(info_surf, (width//2 - info_surf.get_width()//2, panel_rect.y + sv(12)))
+
+def draw_board():
+    win.blit(get_layer(("board", difficulty, first_player), build_board_layer), (0, 0))
     
     # Draw the board symbols
     for i in range(9):
@@ -183,39 +265,35 @@ def draw_board():
         if board[i] == "X":
             # Draw the X with a shadow
             size = cell_size // 3.5
-            offset = 3
+            offset = sv(3)
             
             # Shadow for the X
             pygame.draw.line(win, (*player_color, 100), 
                            (x - size - offset, y - size - offset),
-                           (x + size + offset, y + size + offset), 8)
+                           (x + size + offset, y + size + offset), sv(8))
             pygame.draw.line(win, (*player_color, 100), 
                            (x + size + offset, y - size - offset),
-                           (x - size - offset, y + size + offset), 8)
+                           (x - size - offset, y + size + offset), sv(8))
             
             # Main X strokes
             pygame.draw.line(win, player_color, 
-                           (x - size, y - size), (x + size, y + size), 6)
+                           (x - size, y - size), (x + size, y + size), sv(6))
             pygame.draw.line(win, player_color, 
-                           (x + size, y - size), (x - size, y + size), 6)
+                           (x + size, y - size), (x - size, y + size), sv(6))
             
         elif board[i] == "O":
             # Draw the O with a shadow
             radius = cell_size // 3.5
-            offset = 3
+            offset = sv(3)
             
             # Shadow for the O
-            pygame.draw.circle(win, (*ai_color, 100), (x, y), radius + offset, 8)
+            pygame.draw.circle(win, (*ai_color, 100), (x, y), radius + offset, sv(8))
             
             # Main O circle
-            pygame.draw.circle(win, ai_color, (x, y), radius, 6)
-    
-    # Draw the enhanced status card
-    status_rect = pygame.Rect(40, board_y + board_size + 20, width - 80, 70)
-    draw_shadow(win, status_rect, (0, 0, 0), 12)
-    pygame.draw.rect(win, card_bg, status_rect, border_radius=12)
+            pygame.draw.circle(win, ai_color, (x, y), radius, sv(6))
     
     # Show current game status with enhanced, clearer text
+    status_y = sy(590)
     if not game_over:
         # Show whose turn it is 
         if current_turn == player:
@@ -227,7 +305,7 @@ def draw_board():
             
         turn_surf = sub_font.render(turn_text, True, turn_color)
         win.blit(turn_surf, (width//2 - turn_surf.get_width()//2, 
-                            status_rect.y + 8))
+                            status_y + sv(8)))
         
         # Add a helpful indicator text
         if current_turn == player:
@@ -236,7 +314,7 @@ def draw_board():
             indicator_text = "AI is thinking..."
         indicator_surf = small_font.render(indicator_text, True, light_text)
         win.blit(indicator_surf, (width//2 - indicator_surf.get_width()//2, 
-                                 status_rect.y + 45))
+                                 status_y + sv(45)))
     elif winner:
         # Show winner
         if winner == player:
@@ -246,38 +324,31 @@ def draw_board():
         else:
             result_text = "AI WINS!"
             result_color = ai_color
-            celebration = "Better luck next time!"
+            if forced_win:
+                celebration = "The AI has a forced win from here!"
+            else:
+                celebration = "Better luck next time!"
             
         result_surf = sub_font.render(result_text, True, result_color)
         win.blit(result_surf, (width//2 - result_surf.get_width()//2, 
-                              status_rect.y + 8))
+                              status_y + sv(8)))
         
         # Add celebration/encouragement text
         celebration_surf = small_font.render(celebration, True, medium_text)
         win.blit(celebration_surf, (width//2 - celebration_surf.get_width()//2, 
-                                   status_rect.y + 45))
+                                   status_y + sv(45)))
     else:
         # Show draw message
         draw_text = "IT'S A DRAW!"
         draw_surf = sub_font.render(draw_text, True, medium_text)
         win.blit(draw_surf, (width//2 - draw_surf.get_width()//2, 
-                            status_rect.y + 8))
+                            status_y + sv(8)))
         
         # Add secondary text
         tie_text = "Good game! Play again?"
         tie_surf = small_font.render(tie_text, True, light_text)
         win.blit(tie_surf, (width//2 - tie_surf.get_width()//2, 
-                           status_rect.y + 45))
-    
-    # Draw the control panel
-    panel_rect = pygame.Rect(40, height - 110, width - 80, 80)
-    draw_shadow(win, panel_rect, (0, 0, 0), 15)
-    pygame.draw.rect(win, accent_bg, panel_rect, border_radius=15)
-    
-    # Show game info
-    info_text = f"{difficulty.upper()} MODE  •  {first_player.upper()} STARTS"
-    info_surf = info_font.render(info_text, True, medium_text)
-    win.blit(info_surf, (width//2 - info_surf.get_width()//2, panel_rect.y + 12))
+                           status_y + sv(45)))
     
     # Draw control buttons
     restart_btn.draw()
@@ -286,10 +357,11 @@ def draw_board():
     pygame.display.update()
 
 def reset_game():
-    global board, game_over, winner, current_turn
+    global board, game_over, winner, forced_win, current_turn
     board = [empty] * 9
     game_over = False
     winner = None
+    forced_win = False
     current_turn = player if first_player == "player" else ai
 
 def available_moves(b): 
@@ -340,18 +412,116 @@ def minimax(b, depth, maximizing, alpha, beta):
             if beta <= alpha: break
         return best_score, best_move
 
+# Proof-number search
+pn_inf = 10 ** 9
+pn_node_budget = 50000  # Max nodes kept in the proof tree
+
+class PNNode:
+    def __init__(self, b, to_move, move=None, parent=None):
+        self.board = b
+        self.to_move = to_move
+        self.move = move
+        self.parent = parent
+        self.children = []
+        self.proof = 1
+        self.disproof = 1
+
+def pn_other(side):
+    return ai if side == player else player
+
+def pn_evaluate(node, attacker):
+    w, _ = check_winner(node.board)
+    if w == attacker:
+        node.proof, node.disproof = 0, pn_inf
+    elif w or is_full(node.board):
+        # A loss or a draw both disprove the attacker's win
+        node.proof, node.disproof = pn_inf, 0
+    else:
+        # Initialize by mobility so wide nodes look harder to solve
+        moves = len(available_moves(node.board))
+        if node.to_move == attacker:
+            node.proof, node.disproof = 1, moves
+        else:
+            node.proof, node.disproof = moves, 1
+
+def pn_set_numbers(node, attacker):
+    if node.to_move == attacker:
+        # OR node: one proven child is enough
+        node.proof = min(c.proof for c in node.children)
+        node.disproof = min(pn_inf, sum(c.disproof for c in node.children))
+    else:
+        # AND node: every child must be proven
+        node.proof = min(pn_inf, sum(c.proof for c in node.children))
+        node.disproof = min(c.disproof for c in node.children)
+
+def pn_most_proving(node, attacker):
+    while node.children:
+        if node.to_move == attacker:
+            node = min(node.children, key=lambda c: c.proof)
+        else:
+            node = min(node.children, key=lambda c: c.disproof)
+    return node
+
+def pn_expand(node, attacker):
+    for m in available_moves(node.board):
+        b = node.board[:]
+        b[m] = node.to_move
+        child = PNNode(b, pn_other(node.to_move), m, node)
+        pn_evaluate(child, attacker)
+        node.children.append(child)
+    return len(node.children)
+
+def pn_tree_size(node):
+    return 1 + sum(pn_tree_size(c) for c in node.children)
+
+def prove_win(b, attacker, to_move, budget=pn_node_budget):
+    """Return (True, move) if attacker has a forced win, (False, None) if
+    it has none, or (None, None) if the node budget ran out first."""
+    root = PNNode(b[:], to_move)
+    pn_evaluate(root, attacker)
+    nodes = 1
+
+    while root.proof and root.disproof and nodes < budget:
+        node = pn_most_proving(root, attacker)
+        nodes += pn_expand(node, attacker)
+
+        # Back the new numbers up to the root
+        while node:
+            pn_set_numbers(node, attacker)
+            if node is not root and (node.proof == 0 or node.disproof == 0):
+                # Solved subtrees are no longer needed
+                nodes -= pn_tree_size(node) - 1
+                node.children = []
+            node = node.parent
+
+    if root.proof == 0:
+        for c in root.children:
+            if c.proof == 0:
+                return True, c.move
+        return True, None
+    if root.disproof == 0:
+        return False, None
+    return None, None
+
+def best_move():
+    # Play a proven forced win straight away, otherwise search with minimax
+    proven, move = prove_win(board, ai, ai)
+    if proven and move is not None:
+        return move
+    return minimax(board, 0, True, -math.inf, math.inf)[1]
+
 def ai_pick():
     moves = available_moves(board)
     if not moves:
         return None
-    
+
     if difficulty == "easy":
         return random.choice(moves)
     if difficulty == "medium":
         if random.random() < 0.6: # 60% chance to use minimax
-            return minimax(board, 0, True, -math.inf, math.inf)[1]
+            return best_move()
         return random.choice(moves)
-    return minimax(board, 0, True, -math.inf, math.inf)[1]
+    return best_move()
 
 def draw_winning_line(combo):
     if not combo:
@@ -365,28 +535,29 @@ def draw_winning_line(combo):
     cy = board_y + (c // 3) * cell_size + cell_size // 2
     
     # Draw winning line with shadow
-    line_thickness = 8
-    offset = 3
+    line_thickness = sv(8)
+    offset = sv(3)
     
     # Shadow
     pygame.draw.line(win, (*win_line, 150), 
                     (ax + offset, ay + offset), 
                     (cx + offset, cy + offset), 
-                    line_thickness + 2)
+                    line_thickness + sv(2))
     
     # Main line
     pygame.draw.line(win, win_line, (ax, ay), (cx, cy), line_thickness)
 
 # ======================= GAME LOOP ==========================
-restart_btn = Button(width - 190, height - 70, 140, 38, "Restart", 
+restart_btn = Button(510, 705, 140, 38, "Restart", 
                     mint, green, reset_game)
 
-menu_btn = Button(50, height - 70, 140, 38, "Menu", 
+menu_btn = Button(50, 705, 140, 38, "Menu", 
                  lavender, pink, lambda: None)
 
 def game_loop():
-    global board, game_over, winner, current_turn
+    global board, game_over, winner, forced_win, current_turn
     reset_game()
+    solved_board = None
     
     # Reset menu button function
     def go_to_menu():
@@ -415,11 +586,24 @@ def game_loop():
         elif is_full(board):
             game_over = True
 
+        # End hopeless games early once the AI has a proven forced win
+        if (not game_over and difficulty == "hard"
+                and tuple(board) != solved_board):
+            solved_board = tuple(board)
+            proven, _ = prove_win(board, ai, current_turn)
+            if proven:
+                game_over = True
+                winner = ai
+                forced_win = True
+
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
+            if event.type == pygame.VIDEORESIZE:
+                resize_window(event.w, event.h)
+
             if event.type == pygame.MOUSEBUTTONDOWN:
                 mouse_pos = pygame.mouse.get_pos()
                 
@@ -449,96 +633,60 @@ def game_loop():
         pygame.display.update()
 
 # Choose who starts
-def choose_first_screen():
-    win.fill(background)
+def build_choose_first_layer(layer):
+    layer.fill(background)
     
     # Draw the title card
-    title_card = pygame.Rect(40, 60, width - 80, 120)
-    draw_shadow(win, title_card, (0, 0, 0), 20)
-    pygame.draw.rect(win, card_bg, title_card, border_radius=20)
+    title_card = design_rect(40, 60, 620, 120)
+    draw_shadow(layer, title_card, (0, 0, 0), sv(20))
+    pygame.draw.rect(layer, card_bg, title_card, border_radius=sv(20))
     
     # Title
     title = "Who Starts?"
     title_surf = title_font.render(title, True, dark_text)
-    win.blit(title_surf, (width//2 - title_surf.get_width()//2, 100))
-    
-    # Create the option cards
-    player_card = pygame.Rect(width//2 - 260, 250, 240, 200)
-    ai_card = pygame.Rect(width//2 + 20, 250, 240, 200)
-    
-    # Draw cards with shadows
-    for card in [player_card, ai_card]:
-        draw_shadow(win, card, (0, 0, 0), 15)
-        pygame.draw.rect(win, card_bg, card, border_radius=15)
-        pygame.draw.rect(win, button_border, card, 1, border_radius=15)
-    
-    # Player option display
-    pygame.draw.circle(win, player_color, (player_card.centerx, player_card.centery - 30), 40)
-    player_x = player_card.centerx
-    player_y = player_card.centery - 30
-    size = 25
-    pygame.draw.line(win, card_bg, (player_x - size, player_y - size), 
-                    (player_x + size, player_y + size), 6)
-    pygame.draw.line(win, card_bg, (player_x + size, player_y - size), 
-                    (player_x - size, player_y + size), 6)
-    
-    player_text = button_font.render("You Start", True, dark_text)
-    win.blit(player_text, (player_card.centerx - player_text.get_width()//2, 
-                          player_card.centery + 40))
-    
-    # AI option display
-    pygame.draw.circle(win, ai_color, (ai_card.centerx, ai_card.centery - 30), 40, 6)
-    
-    ai_text = button_font.render("AI Starts", True, dark_text)
-    win.blit(ai_text, (ai_card.centerx - ai_text.get_width()//2, 
-                      ai_card.centery + 40))
-    
-    # Create invisible buttons on top of the cards
-    player_btn = Button(player_card.x, player_card.y, player_card.width, 
-                       player_card.height, "", func=set_player_first)
-    ai_btn = Button(ai_card.x, ai_card.y, ai_card.width, 
-                   ai_card.height, "", func=set_ai_first)
+    layer.blit(title_surf, (width//2 - title_surf.get_width()//2, sy(100)))
+
+def choose_first_screen():
+    # Create invisible buttons on top of the option cards
+    player_btn = Button(90, 250, 240, 200, "", func=set_player_first)
+    ai_btn = Button(370, 250, 240, 200, "", func=set_ai_first)
     
     # Back button
-    back_btn = Button(150, height - 100, 400, 50, "Back to Menu", 
+    back_btn = Button(150, 675, 400, 50, "Back to Menu", 
                      lavender, pink, main_menu)
     
     buttons = [player_btn, ai_btn, back_btn]
     
     while True:
+        win.blit(get_layer("choose_first", build_choose_first_layer), (0, 0))
+        
         # Update hover effects for the cards
         mouse_pos = pygame.mouse.get_pos()
         
-        # Redraw cards to show hover state
-        for i, card in enumerate([player_card, ai_card]):
+        # Draw cards to show hover state
+        for i, card in enumerate([player_btn.rect, ai_btn.rect]):
             is_hover = card.collidepoint(mouse_pos)
             color = button_hover if is_hover else card_bg
             
-            draw_shadow(win, card, (0, 0, 0), 15)
-            pygame.draw.rect(win, color, card, border_radius=15)
-            pygame.draw.rect(win, button_border, card, 1, border_radius=15)
+            draw_shadow(win, card, (0, 0, 0), sv(15))
+            pygame.draw.rect(win, color, card, border_radius=sv(15))
+            pygame.draw.rect(win, button_border, card, 1, border_radius=sv(15))
             
-            # Redraw the symbols on each card
+            # Draw the symbols on each card
             if i == 0:  # Player card
-                pygame.draw.circle(win, player_color, (card.centerx, card.centery - 30), 40)
-                pygame.draw.line(win, card_bg, (card.centerx - 25, card.centery - 55), 
-                                (card.centerx + 25, card.centery - 5), 6)
-                pygame.draw.line(win, card_bg, (card.centerx + 25, card.centery - 55), 
-                                (card.centerx - 25, card.centery - 5), 6)
+                pygame.draw.circle(win, player_color, (card.centerx, card.centery - sv(30)), sv(40))
+                pygame.draw.line(win, card_bg, (card.centerx - sv(25), card.centery - sv(55)), 
+                                (card.centerx + sv(25), card.centery - sv(5)), sv(6))
+                pygame.draw.line(win, card_bg, (card.centerx + sv(25), card.centery - sv(55)), 
+                                (card.centerx - sv(25), card.centery - sv(5)), sv(6))
                 player_text = button_font.render("You Start", True, dark_text)
                 win.blit(player_text, (card.centerx - player_text.get_width()//2, 
-                                      card.centery + 40))
+                                      card.centery + sv(40)))
             else:  # AI card
-                pygame.draw.circle(win, ai_color, (card.centerx, card.centery - 30), 40, 6)
+                pygame.draw.circle(win, ai_color, (card.centerx, card.centery - sv(30)), sv(40), sv(6))
                 ai_text = button_font.render("AI Starts", True, dark_text)
                 win.blit(ai_text, (card.centerx - ai_text.get_width()//2, 
-                                  card.centery + 40))
-        
-        # Draw other UI elements
-        title_card = pygame.Rect(40, 60, width - 80, 120)
-        pygame.draw.rect(win, card_bg, title_card, border_radius=20)
-        title_surf = title_font.render(title, True, dark_text)
-        win.blit(title_surf, (width//2 - title_surf.get_width()//2, 100))
+                                  card.centery + sv(40)))
         
         back_btn.draw()
         
@@ -548,6 +696,9 @@ def choose_first_screen():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
+
+            if event.type == pygame.VIDEORESIZE:
+                resize_window(event.w, event.h)
             
             if event.type == pygame.MOUSEBUTTONDOWN:
                 mouse_pos = pygame.mouse.get_pos()
@@ -567,6 +718,27 @@ def set_ai_first():
     game_loop()
 
 # Main menu
+def build_menu_layer(layer):
+    # Draw the title card
+    title_card = design_rect(40, 40, 620, 180)
+    draw_shadow(layer, title_card, (0, 0, 0), sv(25))
+    pygame.draw.rect(layer, card_bg, title_card, border_radius=sv(25))
+    
+    # Draw the title
+    title = "Tic-Tac-Toe"
+    title_surf = title_font.render(title, True, dark_text)
+    layer.blit(title_surf, (width//2 - title_surf.get_width()//2, sy(80)))
+    
+    # Draw the subtitle
+    subtitle = "Select Difficulty"
+    subtitle_surf = sub_font.render(subtitle, True, medium_text)
+    layer.blit(subtitle_surf, (width//2 - subtitle_surf.get_width()//2, sy(160)))
+    
+    # Draw a decorative line
+    line_y = sy(200)
+    pygame.draw.line(layer, blue, (width//2 - sv(80), line_y), 
+                    (width//2 + sv(80), line_y), sv(2))
+
 def main_menu():
     # Create menu buttons
     easy_btn = Button(150, 300, 400, 60, "Easy", 
@@ -592,7 +764,7 @@ def main_menu():
     circles = []
     for _ in range(8):
         circles.append({
-            'x': random.randint(50, width - 50),
+            'x': random.randint(50, base_width - 50),
             'y': random.randint(100, 200),
             'radius': random.randint(10, 30),
             'color': random.choice([blue, pink, green, 
@@ -607,38 +779,24 @@ def main_menu():
         # Draw floating decorative circles
         for circle in circles:
             circle['x'] += circle['speed'] * circle['direction']
-            if circle['x'] < 50 or circle['x'] > width - 50:
+            if circle['x'] < 50 or circle['x'] > base_width - 50:
                 circle['direction'] *= -1
             
             alpha = 30 + int(math.sin(pygame.time.get_ticks() * 0.001) * 10)
             color_with_alpha = (*circle['color'], alpha)
             
-            circle_surf = pygame.Surface((circle['radius'] * 2, circle['radius'] * 2), 
+            radius = sv(circle['radius'])
+            circle_surf = pygame.Surface((radius * 2, radius * 2), 
                                         pygame.SRCALPHA)
             pygame.draw.circle(circle_surf, color_with_alpha, 
-                             (circle['radius'], circle['radius']), circle['radius'])
-            win.blit(circle_surf, (circle['x'] - circle['radius'], 
-                                  circle['y'] - circle['radius']))
+                             (radius, radius), radius)
+            win.blit(circle_surf, (sx(circle['x']) - radius, 
+                                  sy(circle['y']) - radius))
         
-        # Draw the title card
-        title_card = pygame.Rect(40, 40, width - 80, 180)
-        draw_shadow(win, title_card, (0, 0, 0), 25)
-        pygame.draw.rect(win, card_bg, title_card, border_radius=25)
-        
-        # Draw the title
-        title = "Tic-Tac-Toe"
-        title_surf = title_font.render(title, True, dark_text)
-        win.blit(title_surf, (width//2 - title_surf.get_width()//2, 80))
-        
-        # Draw the subtitle
-        subtitle = "Select Difficulty"
-        subtitle_surf = sub_font.render(subtitle, True, medium_text)
-        win.blit(subtitle_surf, (width//2 - subtitle_surf.get_width()//2, 160))
-        
-        # Draw a decorative line
-        line_y = 200
-        pygame.draw.line(win, blue, (width//2 - 80, line_y), 
-                        (width//2 + 80, line_y), 2)
+        # The title card sits above the circles, so only its area is blitted
+        title_area = design_rect(40, 40, 622, 182)
+        win.blit(get_layer("menu", build_menu_layer, alpha=True), 
+                 title_area, title_area)
         
         # Draw the menu buttons
         for btn in menu_buttons:
@@ -650,6 +808,9 @@ def main_menu():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
+
+            if event.type == pygame.VIDEORESIZE:
+                resize_window(event.w, event.h)
             
             if event.type == pygame.MOUSEBUTTONDOWN:
                 mouse_pos = pygame.mouse.get_pos()